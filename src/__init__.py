@@ -3,6 +3,7 @@
 __version__ = "1.0.0"
 
 from .config import Config
+from .models import Item
 from .repository import ItemRepository
 from .scraper import ScraperService
 from .email_service import EmailService, EmailConfig
@@ -10,6 +11,7 @@ from .watcher_service import AuctionWatcher
 
 __all__ = [
     "Config",
+    "Item",
     "ItemRepository",
     "ScraperService",
     "EmailService",
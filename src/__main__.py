@@ -1,5 +1,5 @@
 """Entry point when running the package as a module: python -m src"""
-from src.watcher import main
+from src.watcher_service import main
 
 if __name__ == "__main__":
     main()
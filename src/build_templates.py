@@ -0,0 +1,50 @@
+"""Build step that precompiles the email templates into Python modules.
+
+Run with: python -m src.build_templates
+"""
+import logging
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from .email_service import COMPILED_TEMPLATES_DIRNAME
+
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+
+def compile_templates(template_dir: Path = TEMPLATE_DIR) -> Path:
+    """Compile all templates in a directory for use with ModuleLoader.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+
+    Returns:
+        Directory the compiled templates were written to
+    """
+    target = template_dir.parent / COMPILED_TEMPLATES_DIRNAME
+    # Autoescaping is decided at compile time, so it must match runtime
+    env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+    env.compile_templates(
+        target=str(target),
+        zip=None,
+        log_function=logger.info,
+        ignore_errors=False,
+    )
+    return target
+
+
+def main() -> None:
+    """Compile the packaged email templates."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    target = compile_templates()
+    print(f"Compiled templates written to {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 """Configuration management for AuctionEye."""
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -8,7 +9,7 @@ from urllib.parse import urlencode, urljoin
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Application configuration loaded from environment variables."""
 
@@ -31,11 +32,12 @@ class Config:
     # HTTP configuration
     user_agent: str
     request_timeout: int
+    fetch_workers: int
 
     # Logging
     log_level: str
 
-    @property
+    @functools.cached_property
     def browse_url(self) -> str:
         """Construct the full browse URL with query parameters."""
         param_string = urlencode(
@@ -46,9 +48,14 @@ class Config:
         return f"{base}?{param_string}"
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls, env_file: Optional[Path] = None) -> "Config":
         """Load configuration from environment variables.
 
+        The most recent load is cached, so repeated calls with the same
+        ``env_file`` parse the .env file and read the environment only once;
+        call ``clear_cache`` to reload.
+
         Args:
             env_file: Optional path to .env file to load
 
@@ -84,6 +91,7 @@ class Config:
             "swap-watcher/1.0 (+personal script; contact owner of this account)",
         )
         request_timeout = int(os.getenv("REQUEST_TIMEOUT", "20"))
+        fetch_workers = int(os.getenv("FETCH_WORKERS", "8"))
 
         return cls(
             base_url=base_url,
@@ -98,5 +106,11 @@ class Config:
             email_to=email_to,
             user_agent=user_agent,
             request_timeout=request_timeout,
+            fetch_workers=fetch_workers,
             log_level=log_level,
         )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Discard the cached configuration so the next load re-reads it."""
+        cls.from_env.cache_clear()
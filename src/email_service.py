@@ -1,18 +1,75 @@
 """Email service for sending auction notifications."""
+import functools
 import logging
 import smtplib
+import time
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Protocol
+from typing import List, Optional, Protocol
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    select_autoescape,
+)
+
+from .models import Item
 
 
 logger = logging.getLogger(__name__)
 
+BYTECODE_CACHE_DIR = Path("~/.cache/auctioneye/jinja").expanduser()
+COMPILED_TEMPLATES_DIRNAME = "_compiled_templates"
+SMTPS_PORT = 465
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_environment(template_dir: Path) -> Environment:
+    """Return a shared Jinja2 environment for the given template directory.
+
+    The environment is cached per directory so templates are only parsed and
+    compiled once per process. If templates were precompiled at build time
+    (see ``src.build_templates``) they are loaded as Python modules;
+    otherwise compiled bytecode is persisted to disk so later processes can
+    skip the compile step.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+
+    Returns:
+        Configured Jinja2 environment
+    """
+    compiled_dir = template_dir.parent / COMPILED_TEMPLATES_DIRNAME
+    if compiled_dir.is_dir():
+        logger.debug("Loading precompiled templates from %s", compiled_dir)
+        return Environment(
+            loader=ModuleLoader(str(compiled_dir)),
+            autoescape=select_autoescape(["html", "xml"]),
+        )
+
+    try:
+        BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=str(BYTECODE_CACHE_DIR))
+    except OSError:
+        logger.warning(
+            "Template bytecode cache unavailable at %s", BYTECODE_CACHE_DIR
+        )
+        bytecode_cache = None
+
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=bytecode_cache,
+        # Templates ship with the package; skip the mtime check on each use
+        auto_reload=False,
+    )
+
 
 class SmtpClient(Protocol):
     """Protocol for SMTP clients (allows for easier testing)."""
@@ -29,6 +86,18 @@ class SmtpClient(Protocol):
         """Send an email message."""
         ...
 
+    def noop(self) -> tuple[int, bytes]:
+        """Check that the connection is still alive."""
+        ...
+
+    def quit(self) -> None:
+        """End the SMTP session."""
+        ...
+
+    def close(self) -> None:
+        """Close the underlying socket."""
+        ...
+
 
 @dataclass
 class EmailConfig:
@@ -39,10 +108,18 @@ class EmailConfig:
     smtp_pass: str
     email_from: str
     email_to: str
+    smtp_max_messages_per_connection: int = 10000
+    smtp_connection_max_age: float = 100.0
 
 
 class EmailService:
-    """Service for formatting and sending email notifications."""
+    """Service for formatting and sending email notifications.
+
+    Used as a context manager, the service keeps one authenticated SMTP
+    connection open and reuses it for every email sent inside the block.
+    """
+
+    _TIMESTAMP_PLACEHOLDER = "__RUN_TIMESTAMP__"
 
     def __init__(
         self,
@@ -56,51 +133,129 @@ class EmailService:
             config: Email configuration
             template_dir: Directory containing Jinja2 email templates
             smtp_factory: Factory function for creating SMTP connections
-                         (defaults to smtplib.SMTP)
+                         (defaults to smtplib.SMTP, or smtplib.SMTP_SSL
+                         on port 465)
         """
         self.config = config
         self.smtp_factory = smtp_factory or self._default_smtp_factory
 
-        # Set up Jinja2 environment for templates
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        # Pooled SMTP connection, only kept open inside a ``with`` block
+        self._smtp: SmtpClient | None = None
+        self._smtp_opened_at = 0.0
+        self._smtp_messages_sent = 0
+        self._keep_alive = False
+
+        # Jinja2 environment is shared across instances for the same directory
+        self.env = get_template_environment(Path(template_dir).resolve())
         self.html_template = self.env.get_template("email.html.j2")
         self.html_no_items_template = self.env.get_template("email-no-items.html.j2")
 
+        # The no-items email only varies by timestamp, so render it once and
+        # substitute the timestamp per run instead of re-rendering
+        self._no_items_html = self.html_no_items_template.render(
+            run_timestamp=self._TIMESTAMP_PLACEHOLDER
+        )
+
+    def __enter__(self) -> "EmailService":
+        self._keep_alive = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._keep_alive = False
+        self.close()
+
+    @property
+    def _implicit_tls(self) -> bool:
+        """Whether the server expects TLS from the start (SMTPS)."""
+        return self.config.smtp_port == SMTPS_PORT
+
     def _default_smtp_factory(self):
-        """Default factory for creating SMTP connections."""
+        """Default factory for creating SMTP connections.
+
+        Port 465 connects with implicit TLS, skipping the STARTTLS upgrade.
+        """
+        if self._implicit_tls:
+            return smtplib.SMTP_SSL(self.config.smtp_host, self.config.smtp_port)
         return smtplib.SMTP(self.config.smtp_host, self.config.smtp_port)
 
+    def _connect(self) -> SmtpClient:
+        """Open and authenticate a new SMTP connection."""
+        smtp = self.smtp_factory()
+        try:
+            if not self._implicit_tls:
+                smtp.starttls()
+            smtp.login(self.config.smtp_user, self.config.smtp_pass)
+        except BaseException:
+            # Don't leak the socket when the handshake fails
+            smtp.close()
+            raise
+
+        self._smtp = smtp
+        self._smtp_opened_at = time.monotonic()
+        self._smtp_messages_sent = 0
+        return smtp
+
+    def _connection_reusable(self, smtp: SmtpClient) -> bool:
+        """Check whether the pooled connection can carry another message."""
+        if self._smtp_messages_sent >= self.config.smtp_max_messages_per_connection:
+            return False
+        age = time.monotonic() - self._smtp_opened_at
+        if age >= self.config.smtp_connection_max_age:
+            return False
+        try:
+            code, _ = smtp.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == 250
+
+    def _get_connection(self) -> SmtpClient:
+        """Return the pooled SMTP connection, reconnecting if it went stale."""
+        if self._smtp is not None and not self._connection_reusable(self._smtp):
+            self.close()
+        if self._smtp is None:
+            return self._connect()
+        return self._smtp
+
+    def close(self) -> None:
+        """Close the pooled SMTP connection, if one is open."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
     def format_email_bodies(
         self,
-        new_items: List[Dict[str, str]]
+        new_items: List[Item],
+        when: Optional[datetime] = None
     ) -> tuple[str, str]:
         """Format plain text and HTML email bodies.
 
         Args:
             new_items: List of new auction items
+            when: Time of the watcher run (defaults to now)
 
         Returns:
             Tuple of (text_body, html_body)
         """
         if not new_items:
-            return self._format_no_items_email()
+            return self._format_no_items_email(when or datetime.now(UTC))
 
         return self._format_new_items_email(new_items)
 
-    def _format_no_items_email(self) -> tuple[str, str]:
+    def _format_no_items_email(self, when: datetime) -> tuple[str, str]:
         """Format email for when there are no new items."""
         text_body = "No new SWAP items.\n\nThe watcher ran successfully."
-        html_body = self.html_no_items_template.render(
-            run_timestamp=datetime.now(UTC).isoformat()
+        html_body = self._no_items_html.replace(
+            self._TIMESTAMP_PLACEHOLDER, when.isoformat()
         )
         return text_body, html_body
 
     def _format_new_items_email(
         self,
-        new_items: List[Dict[str, str]]
+        new_items: List[Item]
     ) -> tuple[str, str]:
         """Format email for new items found.
 
@@ -110,22 +265,28 @@ class EmailService:
         Returns:
             Tuple of (text_body, html_body)
         """
-        # Plain text version
-        text_lines = [f"New SWAP items ({len(new_items)}):", ""]
-        for item in sorted(new_items, key=lambda i: i["title"].lower()):
-            price = item.get("price") or "N/A"
-            text_lines.append(f"- {item['title']} ({price})")
-            text_lines.append(f"  {item['url']}")
-            if item.get("image"):
-                text_lines.append(f"  Image: {item['image']}")
-            text_lines.append("")
-        text_body = "\n".join(text_lines)
+        # Sort once by the precomputed lowercase title and share the order
+        # between the plain text and HTML bodies
+        sorted_items = sorted(new_items, key=attrgetter("title_lc"))
+
+        # Plain text version, one formatted block per item
+        header = f"New SWAP items ({len(new_items)}):\n\n"
+        body = "\n\n".join(map(self._format_text_item, sorted_items))
+        text_body = header + body + "\n"
 
         # HTML version
-        html_body = self.html_template.render(items=new_items)
+        html_body = self.html_template.render(items=sorted_items)
 
         return text_body, html_body
 
+    @staticmethod
+    def _format_text_item(item: Item) -> str:
+        """Format one item as a plain text block (without trailing newline)."""
+        block = f"- {item.title} ({item.price or 'N/A'})\n  {item.url}"
+        if item.image:
+            block += f"\n  Image: {item.image}"
+        return block
+
     def send_email(
         self,
         subject: str,
@@ -154,30 +315,40 @@ class EmailService:
         msg.attach(part_text)
         msg.attach(part_html)
 
-        with self.smtp_factory() as smtp:
-            smtp.starttls()
-            smtp.login(self.config.smtp_user, self.config.smtp_pass)
-            smtp.send_message(msg)
+        try:
+            smtp = self._get_connection()
+            try:
+                smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                logger.info("SMTP connection dropped, reconnecting")
+                self._smtp = None
+                self._connect().send_message(msg)
+            self._smtp_messages_sent += 1
+        finally:
+            if not self._keep_alive:
+                self.close()
 
         logger.info("Email sent successfully to %s", self.config.email_to)
 
     def send_notification(
         self,
-        new_items: List[Dict[str, str]],
-        total_items: int
+        new_items: List[Item],
+        total_items: int,
+        when: Optional[datetime] = None
     ) -> None:
         """Send a notification email about new items.
 
         Args:
             new_items: List of new auction items found
             total_items: Total number of items scanned
+            when: Time of the watcher run (defaults to now)
         """
         if new_items:
             subject = f"{len(new_items)} new SWAP item(s) found"
         else:
             subject = "No new SWAP items"
 
-        text_body, html_body = self.format_email_bodies(new_items)
+        text_body, html_body = self.format_email_bodies(new_items, when)
         self.send_email(subject, text_body, html_body)
 
         logger.info(
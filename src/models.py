@@ -0,0 +1,32 @@
+"""Domain models for AuctionEye."""
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Item:
+    """A single auction listing scraped from the site.
+
+    Slotted and immutable, so each instance is a compact fixed-layout object
+    rather than a per-item dict.
+    """
+    id: str
+    title: str
+    url: str
+    price: Optional[str] = None
+    image: Optional[str] = None
+    # Lowercased title, computed once so sorting needs no per-call str.lower
+    title_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "title_lc", self.title.lower())
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """A previously fetched listing page with its HTTP cache validators."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    # Charset declared in the Content-Type header, if any
+    encoding: Optional[str] = None
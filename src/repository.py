@@ -1,8 +1,14 @@
 """Database repository for tracking seen auction items."""
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Set, Iterable, Protocol
+from typing import Iterator, Optional, Set, Iterable, Protocol
+
+import zstandard
+
+from .models import CachedPage
 
 
 class Connection(Protocol):
@@ -22,7 +28,12 @@ class Connection(Protocol):
 
 
 class ItemRepository:
-    """Repository for managing seen auction items in the database."""
+    """Repository for managing seen auction items in the database.
+
+    A single connection is opened lazily on first use and reused by every
+    method until ``close`` is called. Used as a context manager, the
+    connection is closed when the block exits.
+    """
 
     def __init__(self, db_path: Path):
         """Initialize the repository.
@@ -31,79 +42,272 @@ class ItemRepository:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.Lock()
+        # The page cache is used from the scraper's fetch threads; the lock
+        # also guards the (not thread-safe) zstd contexts
+        self._page_cache_lock = threading.Lock()
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def __enter__(self) -> "ItemRepository":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(commit=exc_type is None)
+
+    def close(self, commit: bool = True) -> None:
+        """Close the shared connection, if one is open.
+
+        Args:
+            commit: Whether to commit (rather than roll back) a transaction
+                    left open on the connection
+        """
+        with self._conn_lock:
+            conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if conn.in_transaction:
+                conn.execute("COMMIT" if commit else "ROLLBACK")
+        finally:
+            conn.close()
 
     def get_connection(self) -> sqlite3.Connection:
         """Create and return a database connection.
 
+        Transactions are managed explicitly (autocommit mode), so writes are
+        grouped with ``BEGIN IMMEDIATE``/``COMMIT`` rather than relying on
+        sqlite3's implicit per-statement transactions.
+
+        WAL mode is persistent in the database file, so it is set once by
+        ``initialize`` rather than on every connection.
+
         Returns:
-            SQLite connection with WAL mode enabled
+            SQLite connection with tuned PRAGMAs
         """
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA journal_mode=WAL;")
+        conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA busy_timeout=30000;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA cache_size=-8000;")
+        try:
+            conn.execute("PRAGMA mmap_size=67108864;")
+        except sqlite3.DatabaseError:
+            # Memory-mapped I/O is an optimization only; some platforms lack it
+            pass
         return conn
 
-    def initialize(self) -> None:
-        """Create the database schema if it doesn't exist."""
-        conn = self.get_connection()
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The shared connection, opened on first access."""
+        if self._conn is None:
+            with self._conn_lock:
+                if self._conn is None:
+                    self._conn = self.get_connection()
+        return self._conn
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in one ``BEGIN IMMEDIATE`` transaction.
+
+        Taking the write lock up front avoids a mid-transaction lock upgrade,
+        and the whole block costs a single commit.
+        """
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
         try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def initialize(self) -> None:
+        """Create the database schema if it doesn't exist.
+
+        Databases created before ``first_seen_at`` became an integer Unix
+        timestamp are migrated in place, and a ``page_cache`` table without
+        the ``encoding`` column gains it.
+        """
+        conn = self.conn
+        conn.execute("PRAGMA journal_mode=WAL;")
+        with self._write_transaction():
+            columns = {
+                row[1]: row[2] for row in conn.execute("PRAGMA table_info(seen_items)")
+            }
+            if columns.get("first_seen_at") == "TEXT":
+                self._migrate_first_seen_to_epoch()
+
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS seen_items (
                     id TEXT PRIMARY KEY,
-                    first_seen_at TEXT NOT NULL
+                    first_seen_at INTEGER NOT NULL
                 )
                 """
             )
-            conn.commit()
-        finally:
-            conn.close()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS page_cache (
+                    page INTEGER PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB NOT NULL,
+                    encoding TEXT
+                )
+                """
+            )
+            page_cache_columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(page_cache)")
+            }
+            if "encoding" not in page_cache_columns:
+                conn.execute("ALTER TABLE page_cache ADD COLUMN encoding TEXT")
+
+    def _migrate_first_seen_to_epoch(self) -> None:
+        """Convert ISO-8601 ``first_seen_at`` values to Unix timestamps."""
+        conn = self.conn
+        conn.execute("ALTER TABLE seen_items RENAME TO seen_items_old")
+        conn.execute(
+            """
+            CREATE TABLE seen_items (
+                id TEXT PRIMARY KEY,
+                first_seen_at INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            INSERT INTO seen_items (id, first_seen_at)
+            SELECT id, COALESCE(CAST(strftime('%s', first_seen_at) AS INTEGER), 0)
+            FROM seen_items_old
+            """
+        )
+        conn.execute("DROP TABLE seen_items_old")
 
     def get_seen_ids(self) -> Set[str]:
         """Retrieve all seen item IDs from the database.
 
+        The watcher uses ``record_seen_ids`` instead; this loads the full
+        history.
+
         Returns:
             Set of item IDs that have been seen before
         """
-        conn = self.get_connection()
-        try:
-            cur = conn.execute("SELECT id FROM seen_items")
-            return {row[0] for row in cur.fetchall()}
-        finally:
-            conn.close()
+        cur = self.conn.cursor()
+        cur.row_factory = lambda _cursor, row: row[0]
+        return set(cur.execute("SELECT id FROM seen_items"))
+
+    def record_seen_ids(
+        self,
+        ids: Iterable[str],
+        when: Optional[datetime] = None
+    ) -> Set[str]:
+        """Mark IDs as seen and return the ones that were not seen before.
+
+        The candidates are loaded into a temporary table and inserted with
+        ``ON CONFLICT DO NOTHING RETURNING id`` (SQLite 3.35+), so the diff
+        and the write happen in one statement and only new IDs come back.
+
+        Args:
+            ids: Item IDs fetched on this run
+            when: Time the items were first seen (defaults to now)
 
-    def add_seen_ids(self, ids: Iterable[str]) -> int:
+        Returns:
+            Set of IDs that were newly inserted
+        """
+        now = int((when or datetime.now(UTC)).timestamp())
+        conn = self.conn
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS candidate (id TEXT)")
+        with self._write_transaction():
+            conn.execute("DELETE FROM candidate")
+            conn.executemany(
+                "INSERT INTO candidate (id) VALUES (?)",
+                ((item_id,) for item_id in ids),
+            )
+            cur = conn.execute(
+                """
+                INSERT INTO seen_items (id, first_seen_at)
+                SELECT DISTINCT id, ? FROM candidate WHERE true
+                ON CONFLICT (id) DO NOTHING
+                RETURNING id
+                """,
+                (now,),
+            )
+            new_ids = {row[0] for row in cur}
+        return new_ids
+
+    def add_seen_ids(
+        self,
+        ids: Iterable[str],
+        when: Optional[datetime] = None
+    ) -> int:
         """Add new item IDs to the seen items table.
 
         Args:
             ids: Iterable of item IDs to mark as seen
+            when: Time the items were first seen (defaults to now)
 
         Returns:
             Number of new items added (excludes duplicates)
         """
-        id_list = list(ids)
-        if not id_list:
-            return 0
-
-        now = datetime.now(UTC).isoformat()
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            cur.executemany(
+        now = int((when or datetime.now(UTC)).timestamp())
+        conn = self.conn
+        changes_before = conn.total_changes
+        with self._write_transaction():
+            conn.executemany(
                 "INSERT OR IGNORE INTO seen_items (id, first_seen_at) VALUES (?, ?)",
-                [(item_id, now) for item_id in id_list],
+                ((item_id, now) for item_id in ids),
+            )
+        return conn.total_changes - changes_before
+
+    def get_cached_page(self, page: int) -> CachedPage | None:
+        """Retrieve the cached copy of a listing page.
+
+        Args:
+            page: Page number
+
+        Returns:
+            Cached page, or None if the page has not been cached
+        """
+        with self._page_cache_lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, body, encoding FROM page_cache "
+                "WHERE page = ?",
+                (page,),
+            ).fetchone()
+            if row is None:
+                return None
+            try:
+                body = self._decompressor.decompress(row[2])
+            except (zstandard.ZstdError, TypeError):
+                # Entry predates compression; treat it as a miss
+                return None
+        return CachedPage(
+            etag=row[0], last_modified=row[1], body=body, encoding=row[3]
+        )
+
+    def store_cached_page(self, page: int, cached: CachedPage) -> None:
+        """Store a listing page and its validators, replacing any prior copy.
+
+        The body is stored zstd-compressed.
+
+        Args:
+            page: Page number
+            cached: Page body, validators and declared charset to store
+        """
+        with self._page_cache_lock:
+            body = self._compressor.compress(cached.body)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO page_cache "
+                "(page, etag, last_modified, body, encoding) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (page, cached.etag, cached.last_modified, body, cached.encoding),
             )
-            rows_affected = cur.rowcount
-            conn.commit()
-            return rows_affected
-        finally:
-            conn.close()
 
     def clear_all(self) -> None:
         """Clear all seen items from the database (useful for testing)."""
-        conn = self.get_connection()
-        try:
-            conn.execute("DELETE FROM seen_items")
-            conn.commit()
-        finally:
-            conn.close()
+        self.conn.execute("DELETE FROM seen_items")
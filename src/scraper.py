@@ -1,15 +1,199 @@
 """Web scraping service for auction items."""
+import codecs
 import logging
-from typing import List, Dict, Protocol
-from urllib.parse import urljoin
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Protocol, Tuple
+from urllib.parse import urljoin, urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+from .models import CachedPage, Item
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ListingFields:
+    """Raw fields captured from one listing section."""
+    id: str
+    href: Optional[str] = None
+    title: Optional[str] = None
+    price: Optional[str] = None
+    image: Optional[str] = None
+
+
+class _ListingState:
+    """Parse state for one open listing section."""
+
+    __slots__ = ("fields", "stack", "in_title", "in_price", "in_img_container", "text")
+
+    def __init__(self, listing_id: str):
+        self.fields = ListingFields(id=listing_id)
+        # One set of roles per open element, starting with the section itself
+        self.stack: List[frozenset] = [frozenset({"listing"})]
+        self.in_title = 0
+        self.in_price = 0
+        self.in_img_container = 0
+        # Text being captured for the "title" and/or "price" fields
+        self.text: Dict[str, List[str]] = {}
+
+    def start(self, tag: str, attrib) -> None:
+        fields = self.fields
+        classes = attrib.get("class", "").split()
+        roles = set()
+
+        if (
+            tag == "a" and "href" in attrib
+            and self.in_title and fields.href is None
+        ):
+            fields.href = attrib["href"]
+            roles.add("title-text")
+            self.text["title"] = []
+        if (
+            tag == "span" and "NumberPart" in classes
+            and self.in_price and "price" not in self.text
+            and fields.price is None
+        ):
+            roles.add("price-text")
+            self.text["price"] = []
+        if (
+            tag == "img" and "src" in attrib
+            and self.in_img_container and fields.image is None
+        ):
+            fields.image = attrib["src"]
+
+        if tag == "h2" and "title" in classes:
+            roles.add("title")
+            self.in_title += 1
+        if tag == "span" and "price" in classes:
+            roles.add("price")
+            self.in_price += 1
+        if tag == "div" and "img-container" in classes:
+            roles.add("img-container")
+            self.in_img_container += 1
+
+        self.stack.append(frozenset(roles))
+
+    def end(self) -> bool:
+        """Close the innermost open element; return True when the section ends."""
+        roles = self.stack.pop()
+        if "title" in roles:
+            self.in_title -= 1
+        if "price" in roles:
+            self.in_price -= 1
+        if "img-container" in roles:
+            self.in_img_container -= 1
+        if "title-text" in roles:
+            self.fields.title = "".join(self.text.pop("title")).strip()
+        if "price-text" in roles:
+            self.fields.price = "".join(self.text.pop("price")).strip()
+        return not self.stack
+
+
+class ItemCollector:
+    """lxml parser target that collects listing sections as they stream by.
+
+    Matches the same elements as the CSS selectors ``h2.title a[href]``,
+    ``span.price span.NumberPart`` and ``div.img-container img[src]``
+    (first match within each ``section[data-listingid]``), but keeps only
+    the fields of the listings being parsed instead of building a tree.
+    """
+
+    def __init__(self):
+        self.listings: List[ListingFields] = []
+        # Listing sections currently open; more than one if they nest
+        self._open: List[_ListingState] = []
+
+    def start(self, tag: str, attrib) -> None:
+        """Handle an opening tag."""
+        for state in self._open:
+            state.start(tag, attrib)
+        if tag == "section" and "data-listingid" in attrib:
+            self._open.append(_ListingState(attrib["data-listingid"]))
+
+    def end(self, tag: str) -> None:
+        """Handle a closing tag."""
+        for state in list(self._open):
+            if state.end():
+                self._open.remove(state)
+                self.listings.append(state.fields)
+
+    def data(self, text: str) -> None:
+        """Handle character data."""
+        for state in self._open:
+            for parts in state.text.values():
+                parts.append(text)
+
+    def close(self) -> List[ListingFields]:
+        """Return the collected listings once parsing finishes."""
+        return self.listings
+
+
+def create_session(pool_size: int, user_agent: str) -> requests.Session:
+    """Create a keep-alive HTTP session sized for concurrent page fetches.
+
+    Transient failures are retried with backoff on the pooled connection
+    instead of failing the whole run.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        user_agent: User agent string sent with every request
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": user_agent})
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Hand the last response back so raise_for_status reports it
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retries,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def declared_charset(headers) -> Optional[str]:
+    """Return the charset explicitly declared in a Content-Type header.
+
+    ``get_encoding_from_headers`` falls back to ISO-8859-1 for ``text/*``
+    types without a charset; that default is ignored here so the parser can
+    still detect the charset from the document itself.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Charset name, or None if none (or an unknown one) is declared
+    """
+    if "charset" not in headers.get("Content-Type", "").lower():
+        return None
+    encoding = get_encoding_from_headers(headers)
+    if not encoding:
+        return None
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        logger.debug("Ignoring unknown charset %r", encoding)
+        return None
+    return encoding
+
+
 class HttpClient(Protocol):
     """Protocol for HTTP clients (allows for easier testing)."""
 
@@ -18,6 +202,18 @@ class HttpClient(Protocol):
         ...
 
 
+class PageCache(Protocol):
+    """Protocol for storing fetched pages for conditional requests."""
+
+    def get_cached_page(self, page: int) -> CachedPage | None:
+        """Return the cached copy of a page, if any."""
+        ...
+
+    def store_cached_page(self, page: int, cached: CachedPage) -> None:
+        """Store a page body with its validators."""
+        ...
+
+
 class ScraperService:
     """Service for scraping auction items from web pages."""
 
@@ -27,7 +223,9 @@ class ScraperService:
         browse_url: str,
         user_agent: str,
         timeout: int = 20,
-        http_client: HttpClient = requests
+        http_client: HttpClient | None = None,
+        max_workers: int = 8,
+        page_cache: PageCache | None = None
     ):
         """Initialize the scraper service.
 
@@ -36,141 +234,203 @@ class ScraperService:
             browse_url: Full URL for browsing items (with query params)
             user_agent: User agent string for HTTP requests
             timeout: Request timeout in seconds
-            http_client: HTTP client to use (defaults to requests module)
+            http_client: HTTP client to use (defaults to a pooled
+                         requests session reused across runs)
+            max_workers: Number of pages fetched concurrently
+            page_cache: Optional store used to send conditional requests
+                        (If-None-Match / If-Modified-Since) for pages
+                        fetched on earlier runs
         """
         self.base_url = base_url
         self.browse_url = browse_url
+        # Page URLs are built by appending to this prefix, so requests does
+        # not have to re-parse browse_url and merge params on every fetch
+        separator = "&" if urlsplit(browse_url).query else "?"
+        self._page_url_prefix = f"{browse_url}{separator}page="
         self.user_agent = user_agent
         self.timeout = timeout
-        self.http_client = http_client
+        self.max_workers = max(1, max_workers)
+        self.http_client = http_client or create_session(
+            self.max_workers, self.user_agent
+        )
+        self.page_cache = page_cache
 
-    def fetch_page_html(self, page: int) -> str:
+    def fetch_page_html(self, page: int) -> Tuple[bytes, Optional[str]]:
         """Fetch HTML content for a specific page number.
 
+        When a page cache is configured the request is conditional, and a
+        304 Not Modified response is served from the cached copy.
+
         Args:
             page: Page number to fetch
 
         Returns:
-            HTML content as string
+            Raw HTML bytes and the charset declared in the Content-Type
+            header (None if the header declares none)
 
         Raises:
             requests.HTTPError: If the request fails
         """
-        params = {"page": page}
         headers = {"User-Agent": self.user_agent}
 
+        cached = self.page_cache.get_cached_page(page) if self.page_cache else None
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         resp = self.http_client.get(
-            self.browse_url,
-            params=params,
+            f"{self._page_url_prefix}{page}",
             headers=headers,
             timeout=self.timeout
         )
+        if cached and resp.status_code == 304:
+            logger.info("Page %d not modified, using cached copy", page)
+            return cached.body, cached.encoding
+
         resp.raise_for_status()
-        return resp.text
 
-    def parse_items_from_html(self, html: str) -> List[Dict[str, str]]:
+        if page == 0:
+            logger.debug(
+                "Page responses use Content-Encoding: %s",
+                resp.headers.get("Content-Encoding", "identity")
+            )
+
+        encoding = declared_charset(resp.headers)
+
+        if self.page_cache:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.page_cache.store_cached_page(
+                    page,
+                    CachedPage(
+                        etag=etag,
+                        last_modified=last_modified,
+                        body=resp.content,
+                        encoding=encoding,
+                    ),
+                )
+
+        return resp.content, encoding
+
+    def parse_items_from_html(
+        self,
+        html: bytes | str,
+        encoding: Optional[str] = None
+    ) -> List[Item]:
         """Parse auction items from HTML content.
 
+        The page is parsed with an ``ItemCollector`` parser target, so only
+        the fields of each listing are kept and no element tree is built.
+        Raw bytes are decoded with ``encoding`` when given; otherwise libxml2
+        detects the charset from the document itself.
+
         Args:
-            html: HTML content to parse
+            html: HTML content to parse, as raw bytes or decoded text
+            encoding: Charset of ``html`` when it is bytes, typically the
+                      one declared in the Content-Type header
 
         Returns:
-            List of item dictionaries with keys: id, title, url, price, image
+            List of items. Items repeated on the page are not deduplicated
+            here.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        items = []
+        if isinstance(html, str):
+            html, encoding = html.encode("utf-8"), "utf-8"
+
+        parser = etree.HTMLParser(target=ItemCollector(), encoding=encoding)
+        listings = etree.fromstring(html, parser)
 
-        for section in soup.find_all("section", attrs={"data-listingid": True}):
+        items = []
+        for listing in listings:
             try:
-                item = self._parse_item_section(section)
+                item = self._build_item(listing)
                 if item:
                     items.append(item)
             except Exception:
                 logger.exception(
-                    "Error parsing section with data-listingid=%r",
-                    section.get("data-listingid")
+                    "Error parsing section with data-listingid=%r", listing.id
                 )
-                continue
 
-        # Deduplicate by id in case items are repeated
-        dedup = {item["id"]: item for item in items}
-        return list(dedup.values())
+        return items
 
-    def _parse_item_section(self, section) -> Dict[str, str] | None:
-        """Parse a single item section from the HTML.
+    def _build_item(self, listing: ListingFields) -> Item | None:
+        """Build an item from the fields captured for one listing section.
 
         Args:
-            section: BeautifulSoup section element
+            listing: Raw listing fields
 
         Returns:
-            Item dictionary or None if section cannot be parsed
+            Item or None if the listing has no usable link or title
         """
-        # Extract link and title
-        link = section.select_one("h2.title a[href]")
-        if not link:
-            logger.debug(
-                "Skipping section without link: %s",
-                section.get("data-listingid")
-            )
+        if listing.href is None:
+            logger.debug("Skipping section without link: %s", listing.id)
             return None
 
-        title = link.get_text(strip=True)
+        title = listing.title
         if not title:
-            logger.debug(
-                "Skipping section with empty title: %s",
-                section.get("data-listingid")
-            )
+            logger.debug("Skipping section with empty title: %s", listing.id)
             return None
 
-        url = urljoin(self.base_url, link["href"])
-        item_id = section.get("data-listingid")
+        url = urljoin(self.base_url, listing.href)
 
-        # Extract price
-        price_tag = section.select_one("span.price span.NumberPart")
-        if not price_tag:
+        price = listing.price
+        if price is None:
             logger.warning(
                 "No price found for listing %s (%r) at %s",
-                item_id, title, url
+                listing.id, title, url
             )
-            price = None
         else:
-            price = price_tag.get_text(strip=True)
-
-        # Extract image
-        image_tag = section.select_one("div.img-container img[src]")
-        image_url = image_tag["src"] if image_tag else None
-
-        return {
-            "id": item_id,
-            "title": title,
-            "url": url,
-            "price": price,
-            "image": image_url
-        }
+            # Prices repeat heavily across listings; share one string each
+            price = sys.intern(price)
+
+        return Item(
+            id=sys.intern(listing.id),
+            title=title,
+            url=url,
+            price=price,
+            image=listing.image
+        )
 
-    def fetch_all_items(self, max_pages: int) -> List[Dict[str, str]]:
+    def fetch_all_items(self, max_pages: int) -> List[Item]:
         """Fetch all items across multiple pages.
 
         Args:
             max_pages: Maximum number of pages to fetch
 
         Returns:
-            List of all items found, deduplicated by ID
+            List of all items found, deduplicated by ID (first occurrence
+            wins)
         """
-        all_items: List[Dict[str, str]] = []
-
-        for page in range(max_pages):
-            logger.info("Fetching page %d", page)
-            html = self.fetch_page_html(page)
-            items = self.parse_items_from_html(html)
-
-            if not items:
-                logger.info("No items found on page %d, stopping", page)
-                break
-
-            logger.info("Found %d items on page %d", len(items), page)
-            all_items.extend(items)
-
-        # Deduplicate across pages
-        by_id = {item["id"]: item for item in all_items}
-        return list(by_id.values())
+        all_items: List[Item] = []
+        seen_this_run: set[str] = set()
+
+        # Pages are fetched concurrently in batches of max_workers and parsed
+        # in order, so fetching stops after the batch holding the first empty
+        # page.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for start in range(0, max_pages, self.max_workers):
+                pages = range(start, min(start + self.max_workers, max_pages))
+                logger.info("Fetching pages %d-%d", pages[0], pages[-1])
+                responses = executor.map(self.fetch_page_html, pages)
+
+                exhausted = False
+                for page, (html, encoding) in zip(pages, responses):
+                    items = self.parse_items_from_html(html, encoding)
+
+                    if not items:
+                        logger.info("No items found on page %d, stopping", page)
+                        exhausted = True
+                        break
+
+                    logger.info("Found %d items on page %d", len(items), page)
+                    for item in items:
+                        if item.id not in seen_this_run:
+                            seen_this_run.add(item.id)
+                            all_items.append(item)
+
+                if exhausted:
+                    break
+
+        return all_items
@@ -1,10 +1,16 @@
-"""Main auction watcher orchestrator."""
+"""Main auction watcher orchestrator and application entry point."""
 import logging
+from datetime import datetime, UTC
+from itertools import compress
+from operator import attrgetter
+from pathlib import Path
 from typing import List, Dict
 
+from .config import Config
 from .repository import ItemRepository
 from .scraper import ScraperService
-from .email_service import EmailService
+from .email_service import EmailService, EmailConfig
+from .models import Item
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +38,7 @@ class AuctionWatcher:
         self.scraper = scraper
         self.email_service = email_service
         self.max_pages = max_pages
+        self.run_started_at: datetime | None = None
 
     def run(self) -> Dict[str, int]:
         """Run a single check for new auction items.
@@ -39,31 +46,29 @@ class AuctionWatcher:
         Returns:
             Dictionary with 'new_items' and 'total_items' counts
         """
+        self.run_started_at = datetime.now(UTC)
         logger.info("Starting auction watcher run")
 
-        # Initialize database if needed
-        self.repository.initialize()
+        with self.repository:
+            # Initialize database if needed
+            self.repository.initialize()
 
-        # Get previously seen items
-        seen_ids = self.repository.get_seen_ids()
-        logger.info("Found %d previously seen items", len(seen_ids))
+            # Fetch current items
+            all_items = self.scraper.fetch_all_items(self.max_pages)
+            logger.info("Fetched %d total items", len(all_items))
 
-        # Fetch current items
-        all_items = self.scraper.fetch_all_items(self.max_pages)
-        logger.info("Fetched %d total items", len(all_items))
+            # Record every fetched item; only the newly inserted IDs come back
+            new_ids = self.repository.record_seen_ids(
+                [item.id for item in all_items], when=self.run_started_at
+            )
+            new_items = self._filter_new_items(all_items, new_ids)
+            logger.info("Identified and recorded %d new items", len(new_items))
 
-        # Identify new items
-        new_items = self._filter_new_items(all_items, seen_ids)
-        logger.info("Identified %d new items", len(new_items))
-
-        # Record new items
-        if new_items:
-            new_ids = {item["id"] for item in new_items}
-            rows_added = self.repository.add_seen_ids(new_ids)
-            logger.info("Added %d new item IDs to database", rows_added)
-
-        # Send notification
-        self.email_service.send_notification(new_items, len(all_items))
+        # Send notification over one SMTP session held for the run
+        with self.email_service:
+            self.email_service.send_notification(
+                new_items, len(all_items), when=self.run_started_at
+            )
 
         return {
             "new_items": len(new_items),
@@ -72,16 +77,93 @@ class AuctionWatcher:
 
     def _filter_new_items(
         self,
-        all_items: List[Dict[str, str]],
-        seen_ids: set
-    ) -> List[Dict[str, str]]:
+        all_items: List[Item],
+        new_ids: set
+    ) -> List[Item]:
         """Filter items to find only new ones.
 
         Args:
             all_items: All items fetched from the site
-            seen_ids: Set of previously seen item IDs
+            new_ids: Set of item IDs not seen before
 
         Returns:
-            List of new items not in seen_ids
+            List of items whose ID is in new_ids, in fetch order
         """
-        return [item for item in all_items if item["id"] not in seen_ids]
+        # compress/map/attrgetter keep the whole loop in C
+        is_new = map(new_ids.__contains__, map(attrgetter("id"), all_items))
+        return list(compress(all_items, is_new))
+
+
+def setup_logging(log_level: str) -> None:
+    """Configure logging for the application."""
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+
+
+def create_watcher(config: Config) -> AuctionWatcher:
+    """Create and configure the auction watcher with all dependencies.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Configured AuctionWatcher instance
+    """
+    # Create repository
+    repository = ItemRepository(config.db_path)
+
+    # Create scraper
+    scraper = ScraperService(
+        base_url=config.base_url,
+        browse_url=config.browse_url,
+        user_agent=config.user_agent,
+        timeout=config.request_timeout,
+        max_workers=config.fetch_workers,
+        page_cache=repository,
+    )
+
+    # Create email service
+    email_config = EmailConfig(
+        smtp_host=config.smtp_host,
+        smtp_port=config.smtp_port,
+        smtp_user=config.smtp_user,
+        smtp_pass=config.smtp_pass,
+        email_from=config.email_from,
+        email_to=config.email_to,
+    )
+    template_dir = Path(__file__).resolve().parent / "templates"
+    email_service = EmailService(email_config, template_dir)
+
+    # Create watcher with all dependencies
+    return AuctionWatcher(
+        repository=repository,
+        scraper=scraper,
+        email_service=email_service,
+        max_pages=config.max_pages,
+    )
+
+
+def main() -> None:
+    """Main entry point for the auction watcher."""
+    # Load configuration
+    config = Config.from_env()
+
+    # Set up logging
+    setup_logging(config.log_level)
+
+    try:
+        # Create and run watcher
+        watcher = create_watcher(config)
+        result = watcher.run()
+
+        # Print summary
+        print(
+            f"Email sent. New items: {result['new_items']}. "
+            f"Total items on page(s): {result['total_items']}."
+        )
+
+    except Exception:
+        logger.exception("Fatal error during watcher execution")
+        raise